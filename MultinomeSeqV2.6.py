@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # multinome_seq_tracks_velocity.py  –  4-track Monome sequencer (per-step velocity)
 
-import asyncio, functools, contextlib, queue, threading, json
+import asyncio, functools, contextlib, heapq, threading, json, time, os, itertools, sys, ctypes
 import tkinter as tk
 from tkinter import filedialog
 import monome, rtmidi
@@ -24,6 +24,15 @@ GATE_RATIO  = 0.9
 TRACKS      = 6
 VEL_DEF     = 100          # velocity set by normal click
 VEL_INC     = 15           # velocity increase on shift-click
+SLEEP_RES   = 0.001        # clock thread sleeps until this close to a deadline, then spins
+LOOKAHEAD   = 0.005        # internal clock queues each step this early; the sender fires it on time
+FRAME_MS    = 33           # GUI repaint interval (~30 fps)
+TK_PUMP_MS  = 16           # Tk event processing interval (~60 Hz)
+MIDI_CLOCK  = b'\xF8'       # one 24 PPQN clock pulse; six per 16th-note step
+PORTS_POLL  = 1.0          # seconds between background MIDI port re-listings
+PORTS_TTL   = 1.5          # a listing older than this is re-queried on demand (watcher stalled/not started)
+SEQLOCK_WAIT = 0.002       # clock thread skips a track's step if an edit holds it this long
+GRID_INFO_TIMEOUT = 2.0    # seconds to wait for a newly connected grid to report id/size
 # The main clock ticks once per 16th note. These values are multiples of that base tick.
 SUBDIVISIONS = {
     "1/16": 1,
@@ -47,37 +56,200 @@ SCALES = {
     "Major Pentatonic": [0, 2, 4, 7, 9],
 }
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+LED_ON = bytes([0] + [1]*255)  # bytes.translate table: any velocity > 0 -> LED on
+# Column bitmask -> rows whose bit is set, for every possible mask (256 for 8 rows)
+MASK_ROWS = tuple(tuple(r for r in range(ROWS) if m >> r & 1) for m in range(1 << ROWS))
+# GUI cell colours by velocity: off, low (1-40), medium (41-80), high (81-127)
+FILL_OFF, FILL_LOW, FILL_MED, FILL_HIGH = "#444", "#3366FF", "#33CC33", "#FFCC00"
+VEL_FILL = (FILL_OFF,) + (FILL_LOW,)*40 + (FILL_MED,)*40 + (FILL_HIGH,)*47  # index = velocity
 # ─────────────────────────────────────────────────────────
 
 # ───────── data classes ─────────────────────────────────
 class Track:
+    # Fixed attribute set: slot access is cheaper on the per-step hot path
+    __slots__ = ("name", "steps", "col_masks", "playcol", "_midi_chan", "midi_out_port",
+                 "mute", "_scale", "_root_note", "_notes", "_playable", "_on_heads",
+                 "_offs_by_mask", "subdivision", "_version")
+
     def __init__(self, name, midi_chan=0, cols=0):
         self.name       = name
-        self.steps      = [[0]*cols for _ in range(ROWS)]   # 0 = off, 1-127 = velocity
+        self.steps      = [bytearray(cols) for _ in range(ROWS)]   # 0 = off, 1-127 = velocity
+        self.col_masks  = bytearray(cols)  # per column: bit r set when steps[r][col] > 0
         self.playcol    = 0
-        self.midi_chan  = midi_chan
+        self._midi_chan = midi_chan
         self.midi_out_port = "MonomeSeq Out"  # Default MIDI output port name
         self.mute       = False
-        self.scale      = "Major"
-        self.root_note  = 60  # C4
+        self._scale     = "Major"
+        self._root_note = 60  # C4
+        self._version   = 0   # seqlock: odd while steps/masks/note tables are being edited
+        self._update_notes()
         self.subdivision = 1  # Pulses per step (default: 16th note = 1 pulse)
 
+    # midi_chan/root_note/scale setters rebuild the per-row MIDI messages used by _step
+    @property
+    def midi_chan(self): return self._midi_chan
+
+    @midi_chan.setter
+    def midi_chan(self, value):
+        with self.editing():
+            self._midi_chan = value
+            self._update_msgs()
+
+    @property
+    def root_note(self): return self._root_note
+
+    @root_note.setter
+    def root_note(self, value):
+        with self.editing():
+            self._root_note = value
+            self._update_notes()
+
+    @property
+    def scale(self): return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        with self.editing():
+            self._scale = value
+            self._update_notes()
+
+    @contextlib.contextmanager
+    def editing(self):
+        """Write side of the seqlock the clock thread reads steps through (see
+        read_column). Edits run on the asyncio thread and must not nest."""
+        self._version += 1
+        try:
+            yield
+        finally:
+            self._version += 1
+
+    def read_column(self, pos):
+        """Returns (column, note-ons, note-offs) at step position pos, with None messages
+        for an empty column. Reader side of the seqlock: runs on the clock thread while
+        the GUI edits, so a read that overlapped an edit (or tripped over one mid-way) is
+        retried, for up to SEQLOCK_WAIT before the step is skipped for this track."""
+        deadline = None
+        while True:
+            version = self._version
+            if not version & 1:
+                try:
+                    masks = self.col_masks
+                    if not masks:
+                        return 0, None, None
+                    col = pos % len(masks)
+                    mask = masks[col] & self._playable
+                    ons = offs = None
+                    if mask:
+                        steps, on_heads = self.steps, self._on_heads
+                        ons = bytearray()
+                        for r in MASK_ROWS[mask]:  # active rows only, straight from the table
+                            ons += on_heads[r]          # prebuilt status + note
+                            ons.append(steps[r][col])   # this step's velocity
+                        offs = self._offs_by_mask[mask]
+                    if self._version == version:
+                        return col, ons, offs
+                except (IndexError, TypeError):
+                    if self._version == version:
+                        raise  # no edit overlapped, so this is a real bug
+            now = time.perf_counter()
+            if deadline is None:
+                deadline = now + SEQLOCK_WAIT
+            elif now >= deadline:
+                print(f"⚠ {self.name}: step skipped, edit still in progress")
+                return self.playcol, None, None
+            time.sleep(0)  # let the edit finish (releases the GIL)
+
+    def _update_notes(self):
+        intervals = SCALES.get(self._scale, SCALES["Chromatic"])
+        degrees = len(intervals)
+        self._notes = [self._root_note + (r // degrees) * 12 + intervals[r % degrees]
+                       for r in range(ROWS)]
+        # Rows whose note is within MIDI range; rows outside 0-127 are never sent
+        self._playable = sum(1 << r for r, n in enumerate(self._notes) if 0 <= n <= 127)
+        self._update_msgs()
+
+    def _update_msgs(self):
+        # Per row: note-on status+note (velocity is appended per step). Unplayable rows
+        # get None; _playable keeps them out of _step.
+        on, off = 0x90 | self._midi_chan, 0x80 | self._midi_chan
+        self._on_heads = [bytes((on, n)) if 0 <= n <= 127 else None for n in self._notes]
+        # Note-offs don't depend on velocity, so prebuild the whole batch for every
+        # column mask; _step appends one entry per track instead of looping over rows
+        off_msgs = [bytes((off, n, 0)) if 0 <= n <= 127 else b"" for n in self._notes]
+        self._offs_by_mask = [b"".join(off_msgs[r] for r in rows) for rows in MASK_ROWS]
+
+    def set_step(self, row, col, vel):
+        """Sets a step velocity and keeps the column bitmask in sync."""
+        with self.editing():
+            self.steps[row][col] = vel
+            if vel > 0:
+                self.col_masks[col] |= 1 << row
+            else:
+                self.col_masks[col] &= 0xFF ^ (1 << row)  # bytearray items can't go negative
+
+    def set_steps(self, steps):
+        """Replaces the whole step matrix (ROWS bytearrays) and its column bitmasks."""
+        with self.editing():
+            self.steps = steps
+            self.rebuild_col_masks()
+
+    def rebuild_col_masks(self):
+        """Recomputes every column bitmask from the step matrix."""
+        cols = len(self.steps[0]) if self.steps else 0
+        masks = bytearray(cols)
+        for r in range(ROWS):
+            for c, vel in enumerate(self.steps[r]):
+                if vel > 0:
+                    masks[c] |= 1 << r
+        self.col_masks = masks
+
 class SeqState:
+    __slots__ = ("cols", "tracks", "cur_idx", "running", "_bpm", "_swing",
+                 "_step_times", "_gate_time", "midi_in_chan",
+                 "clock_mode", "tick_count", "beat_counter", "dirty")
+
     def __init__(self):
         self.cols       = 0
         self.tracks     = [Track(f"Track{i+1}", i, self.cols) for i in range(TRACKS)]
         self.cur_idx    = 0
         self.running    = True
-        self.bpm        = 120
-        self.swing      = 0.0
+        self._bpm       = 120
+        self._swing     = 0.0
+        self._update_step_times()
         self.midi_in_chan = 0           # 0 = All, 1-16
         self.clock_mode = "internal"   # internal | send | receive
         self.tick_count = 0            # For external MIDI clock
         self.beat_counter = 0          # For swing calculation
+        self.dirty      = True         # GUI grid needs a repaint
 
     @property
     def cur(self): return self.tracks[self.cur_idx]
 
+    # bpm/swing setters refresh the cached step lengths read by the clock
+    @property
+    def bpm(self): return self._bpm
+
+    @bpm.setter
+    def bpm(self, value):
+        self._bpm = value
+        self._update_step_times()
+
+    @property
+    def swing(self): return self._swing
+
+    @swing.setter
+    def swing(self, value):
+        self._swing = value
+        self._update_step_times()
+
+    def _update_step_times(self):
+        step = 60 / self._bpm / 4              # one 16th note, in seconds
+        even, odd = step * (1 - self._swing), step * (1 + self._swing)
+        # (length, gate) by step parity, swapped in as one tuple so the clock thread
+        # never reads half of a tempo or swing change
+        self._step_times = ((even, even * GATE_RATIO), (odd, odd * GATE_RATIO))
+        self._gate_time = step * GATE_RATIO    # for externally clocked steps
+
     def resize_tracks(self, new_cols):
         """Resizes the step matrix for all tracks."""
         self.cols = new_cols
@@ -92,11 +264,10 @@ class SeqState:
             if new_cols == old_cols:
                 continue
 
-            new_steps = [[0] * new_cols for _ in range(ROWS)]
-            for r in range(ROWS):
-                for c in range(min(old_cols, new_cols)):
-                    new_steps[r][c] = track.steps[r][c]
-            track.steps = new_steps
+            keep = min(old_cols, new_cols)
+            with track.editing():
+                track.steps = [row[:keep] + bytearray(new_cols - keep) for row in track.steps]
+                track.col_masks = track.col_masks[:keep] + bytearray(new_cols - keep)
 
 state = SeqState()
 # ─────────────────────────────────────────────────────────
@@ -112,6 +283,21 @@ class Backend:
             # Older API
             return midi_obj.get_ports()
     
+    def list_ports(self, is_input):
+        """Input or output port names for the menus, re-queried at most every PORTS_TTL
+        seconds; [] if no input is open. Opening a port by name must use the live list
+        from _get_port_names instead, since indices shift when devices come and go.
+        """
+        midi_obj = self.midi_in if is_input else self.midi_out
+        if midi_obj is None:
+            return []
+        now = time.monotonic()
+        ts, names = self._ports_cache.get(is_input, (None, None))
+        if ts is None or now - ts >= PORTS_TTL:
+            names = self._get_port_names(midi_obj)
+            self._ports_cache[is_input] = (now, names)
+        return list(names)
+
     def _open_port(self, midi_obj, port_num):
         """Helper to open a port with API compatibility."""
         try:
@@ -121,6 +307,7 @@ class Backend:
     
     def _open_virtual_port(self, midi_obj, name):
         """Helper to open virtual port with API compatibility."""
+        self._ports_cache.clear()  # our new virtual port shows up in the listings
         try:
             return midi_obj.openVirtualPort(name)
         except AttributeError:
@@ -140,12 +327,12 @@ class Backend:
         except AttributeError:
             return midi_obj.close_port()
     
-    def _send_message(self, midi_obj, msg):
-        """Helper to send message with API compatibility."""
+    def _sender(self, midi_obj):
+        """Helper to resolve the send method once with API compatibility."""
         try:
-            return midi_obj.sendMessage(msg)
+            return midi_obj.sendMessage
         except AttributeError:
-            return midi_obj.send_message(msg)
+            return midi_obj.send_message
     
     def _ignore_types(self, midi_obj, sysex, time, active_sense):
         """Helper to ignore types with API compatibility."""
@@ -163,6 +350,7 @@ class Backend:
     
     def __init__(self, loop):
         self.loop = loop
+        self._ports_cache = {}  # is-input flag -> (time.monotonic(), port names)
         # threaded MIDI-out - maintain backward compatibility
         self.midi_out = MidiOut()
         outs = self._get_port_names(self.midi_out)
@@ -172,12 +360,20 @@ class Backend:
         self.midi_outputs = {}  # port_name -> MidiOut object
         self.midi_outputs["MonomeSeq Out"] = self.midi_out  # Default port
         
-        self.midi_q   = queue.Queue()
+        # One shared deadline-ordered heap for every outgoing message, note-offs included
+        self._midi_heap = []                   # (deadline, seq, port_name, msg)
+        self._midi_cv   = threading.Condition()
+        self._msg_seq   = itertools.count()    # keeps equal deadlines in FIFO order
         threading.Thread(target=self._midi_worker, daemon=True).start()
 
+        # Absolute time of the next clock step; advanced by whole steps so error never accumulates
+        self._logical_time = time.perf_counter()
+        # Set from any thread; only the clock thread moves beat_counter (see _rewind)
+        self._rewind_pending = False
+
         # MIDI-in for external clock
         self.midi_in = None
-        self.midi_clock_pending = False  # Flag for pending clock ticks
+        self._clock_pulse = threading.Event()  # set once per 6 external clock ticks
         self._setup_midi_input()
         
     def _setup_midi_input(self):
@@ -188,7 +384,7 @@ class Backend:
             self.midi_in = MidiIn()
             self._ignore_types(self.midi_in, False, False, False)  # Don't ignore timing messages
             
-            ins = self._get_port_names(self.midi_in)
+            ins = self.list_ports(True)
             print(f"Available MIDI input ports: {ins}")
             
             if ins: 
@@ -206,30 +402,79 @@ class Backend:
         self.grid_map, self.offsets, self.gui = {}, {}, None
         self.press_times, self.running = {}, True  # track key press timestamps
         self.grid_lock = asyncio.Lock()
-
-    # threaded sender
+        self._last_frame = {}  # grid id -> LED frame last sent to that grid
+        self._spare_frame = {}  # grid id -> reusable buffer for the next frame
+        self._monome_pending = False  # a coalesced redraw_monome is scheduled
+
+    def _raise_thread_priority(self):
+        """Best-effort real-time scheduling for the calling thread (Linux, macOS)."""
+        if hasattr(os, "sched_setscheduler"):  # Linux: applies to the calling thread
+            with contextlib.suppress(OSError):  # needs CAP_SYS_NICE or root
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        elif sys.platform == "darwin":
+            class SchedParam(ctypes.Structure):
+                _fields_ = [("sched_priority", ctypes.c_int), ("opaque", ctypes.c_char * 4)]
+            SCHED_FIFO = 4  # <sys/sched.h> on Darwin
+            with contextlib.suppress(Exception):
+                libc = ctypes.CDLL("/usr/lib/libSystem.dylib")
+                libc.pthread_self.restype = ctypes.c_void_p
+                libc.pthread_setschedparam.argtypes = [ctypes.c_void_p, ctypes.c_int,
+                                                       ctypes.POINTER(SchedParam)]
+                param = SchedParam(libc.sched_get_priority_max(SCHED_FIFO))
+                libc.pthread_setschedparam(libc.pthread_self(), SCHED_FIFO, ctypes.byref(param))
+
+    # threaded sender: messages leave the queue in deadline order, each at its deadline
     def _midi_worker(self):
+        self._raise_thread_priority()
         while True:
-            msg = self.midi_q.get()
-            if msg is None: break
-            
-            # Check if message includes port specification
-            if isinstance(msg, tuple) and len(msg) == 2:
-                port_name, midi_data = msg
-                midi_out = self.get_midi_output(port_name)
+            # Sleep until the earliest deadline; producers only wake us for a new head
+            with self._midi_cv:
+                while True:
+                    if self._midi_heap:
+                        wait = self._midi_heap[0][0] - time.perf_counter() - SLEEP_RES
+                        if wait <= 0:
+                            item = heapq.heappop(self._midi_heap)
+                            break
+                        self._midi_cv.wait(wait)
+                    else:
+                        self._midi_cv.wait()
+            self._sleep_until(item[0])
+
+            _, _, port_name, midi_data = item
+            if midi_data is None: break
+            midi_out = self.midi_out if port_name is None else self.get_midi_output(port_name)
+            # rtmidi takes one message per call, so a batch goes out back-to-back
+            # through a send method resolved once per batch
+            send = self._sender(midi_out)
+            for msg in self._split_messages(midi_data):
                 with contextlib.suppress(Exception):
-                    self._send_message(midi_out, midi_data)
+                    send(msg)
+
+    @staticmethod
+    def _split_messages(data):
+        """Splits a byte stream of complete MIDI messages (no running status) into messages."""
+        i = 0
+        while i < len(data):
+            status = data[i]
+            if status < 0xC0 or 0xE0 <= status < 0xF0 or status == 0xF2:
+                n = 3
+            elif status < 0xE0 or status in (0xF1, 0xF3):
+                n = 2
             else:
-                # Default behavior - use main MIDI output
-                with contextlib.suppress(Exception):
-                    self._send_message(self.midi_out, msg)
-
-    def qmsg(self, *b): 
-        self.midi_q.put(list(b))
-    
-    def qmsg_to_port(self, port_name, *b):
-        """Send MIDI message to specific port."""
-        self.midi_q.put((port_name, list(b)))
+                n = 1
+            yield data[i:i + n]
+            i += n
+
+    def qbatch_at(self, when, port_name, buf):
+        """Queue complete MIDI messages for a port (None = default) as one entry,
+        sent back-to-back at a time.perf_counter() deadline `when`."""
+        self._push_msg((when, next(self._msg_seq), port_name, bytes(buf)))  # no copy if already bytes
+
+    def _push_msg(self, item):
+        with self._midi_cv:
+            heapq.heappush(self._midi_heap, item)
+            if self._midi_heap[0] is item:
+                self._midi_cv.notify()
     
     def get_midi_output(self, port_name):
         """Get or create MIDI output for specific port."""
@@ -261,7 +506,10 @@ class Backend:
         self.midi_out = MidiOut()
         outs = self._get_port_names(self.midi_out)
         for i,p in enumerate(outs):
-            if p==name: self._open_port(self.midi_out, i); return
+            if p==name:
+                self._open_port(self.midi_out, i)
+                self._ports_cache.clear()
+                return
         self._open_virtual_port(self.midi_out, "MonomeSeq Out (virtual)")
 
     def set_in_port(self, name: str):
@@ -273,7 +521,7 @@ class Backend:
                 self._close_port(self.midi_in)
         
         # Find and open the new port
-        ins = self._get_port_names(self.midi_in)
+        ins = self._get_port_names(self.midi_in) if self.midi_in else []
         for i, p in enumerate(ins):
             if p == name: 
                 try:
@@ -297,6 +545,33 @@ class Backend:
     async def start(self) -> None:
         asyncio.create_task(self._serialosc())
         threading.Thread(target=self._threaded_clock_loop, daemon=True).start()
+        threading.Thread(target=self._watch_ports, daemon=True).start()
+
+    # MIDI devices have no hot-plug events in rtmidi (grids get them from serialosc),
+    # so ports are re-listed off the UI thread and the menus refreshed only on a change
+    def _watch_ports(self):
+        try:
+            # Own handles: the live ports stay with the sender and input threads
+            probes = {False: MidiOut(), True: MidiIn()}
+        except Exception as e:
+            print(f"MIDI port watcher disabled: {e}")
+            return
+        while self.running:
+            time.sleep(PORTS_POLL)
+            if not self.running:
+                break  # shut down during the sleep; the loop may already be closed
+            changed = False
+            for is_input, probe in probes.items():
+                try:
+                    names = self._get_port_names(probe)
+                except Exception:
+                    continue
+                ts, old = self._ports_cache.get(is_input, (None, None))
+                changed = changed or names != old
+                self._ports_cache[is_input] = (time.monotonic(), names)
+            if changed and self.gui:
+                with contextlib.suppress(RuntimeError):  # loop closed mid-shutdown
+                    self.loop.call_soon_threadsafe(self.gui._refresh_midi_ports)
 
     async def _serialosc(self):
         try:
@@ -325,6 +600,8 @@ class Backend:
                 return
             print(f"Monome '{id_}' found. Proceeding with removal and resize...")    
             grid_to_remove = self.grid_map.get(id_)
+            self._last_frame.pop(id_, None)
+            self._spare_frame.pop(id_, None)
 
             # --- 1. Attempt to cleanly disconnect the hardware ---
             if grid_to_remove:
@@ -369,13 +646,41 @@ class Backend:
                 self.gui._refresh_ui()
             self.redraw_monome()
 
+    @staticmethod
+    async def _wait_grid_info(g, ready, has_event, timeout=GRID_INFO_TIMEOUT):
+        """Waits until the grid has reported its id and size; False on timeout."""
+        if g.id is not None and g.width is not None:
+            return True
+        if has_event:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(ready.wait(), timeout)
+            return g.id is not None and g.width is not None
+        # No ready event in this monome version: back off instead of a hot 10 ms poll
+        deadline = asyncio.get_running_loop().time() + timeout
+        delay = 0.005
+        while g.id is None or g.width is None:
+            if asyncio.get_running_loop().time() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+        return True
+
     async def _setup_grid(self,g,port):
         """Adds a new grid, resizing the sequencer and GUI."""
         async with self.grid_lock:
             start_time = asyncio.get_event_loop().time()
+            # Wait for the grid's info reply instead of polling g.id; hook the event
+            # before connecting so an early reply isn't missed
+            ready = asyncio.Event()
+            ready_event = getattr(g, "ready_event", None)
+            if ready_event is not None:
+                ready_event.add_handler(lambda *_: ready.set())
             await g.connect("127.0.0.1",port)
-            while g.id is None or g.width is None:
-                await asyncio.sleep(0.01)
+            if not await self._wait_grid_info(g, ready, ready_event is not None):
+                print(f"No info reply from grid on port {port}; ignoring it.")
+                with contextlib.suppress(Exception):
+                    g.disconnect()
+                return
 
             connect_duration = asyncio.get_event_loop().time() - start_time
             print(f"Initial connection for '{g.id}' established in {connect_duration:.4f} seconds.")
@@ -399,6 +704,7 @@ class Backend:
                 g.led_all(1)
                 await asyncio.sleep(1)
                 g.led_all(0)
+                self._last_frame.pop(g.id, None)
                 print(f"Output to '{g.id}' appears stable.")
             except Exception as e:
                 print(f"Error during hardware handshake with '{g.id}': {e}")
@@ -408,6 +714,7 @@ class Backend:
                 return
 
             # --- 3. Now subscribe to the INPUT channel. ---
+            # partial binds the grid in C, without an extra Python frame per key event
             g.key_event.add_handler(functools.partial(self._on_key,g))
             print(f"Key handler registered for '{g.id}'.")
 
@@ -441,129 +748,207 @@ class Backend:
         key = (g.id, vx, vy)
 
         if s:  # key down
-            self.press_times[key] = asyncio.get_event_loop().time()
+            self.press_times[key] = self.loop.time()
         else:  # key up
             start_time = self.press_times.pop(key, None)
             if start_time is None:
                 return
-            duration = asyncio.get_event_loop().time() - start_time
+            duration = self.loop.time() - start_time
 
             vel = cur.steps[vy][vx]
             if duration >= 0.5:
                 # Long press → clear step
-                cur.steps[vy][vx] = 0
+                cur.set_step(vy, vx, 0)
             else:
                 # Short press → cycle velocity
                 if vel == 0:
-                    cur.steps[vy][vx] = 40
+                    cur.set_step(vy, vx, 40)
                 elif vel == 40:
-                    cur.steps[vy][vx] = 80
+                    cur.set_step(vy, vx, 80)
                 elif vel == 80:
-                    cur.steps[vy][vx] = 127
+                    cur.set_step(vy, vx, 127)
                 else:
-                    cur.steps[vy][vx] = 0
+                    cur.set_step(vy, vx, 0)
 
-            if self.gui and self.gui.canvas.winfo_exists():
-                try:
-                    self.gui.draw_grid()
-                except tk.TclError as e:
-                    print(f"GUI Error during draw_grid: {e}")
-            self.redraw_monome()
+            if self.gui: self.gui.request_redraw()
+            self.request_monome_redraw()  # coalesces fast runs of key presses
 
     # LED redraw (steps of current track, playheads all)
+    def request_monome_redraw(self):
+        """Redraws the grids once the loop is free; repeated calls coalesce.
+        Safe to call from the clock thread."""
+        if not self._monome_pending:
+            self._monome_pending = True
+            self.loop.call_soon_threadsafe(self._do_monome_redraw)
+
+    def _do_monome_redraw(self):
+        self._monome_pending = False
+        self.redraw_monome()
+
     def redraw_monome(self):
+        tr = state.cur
+        playcol = None if tr.mute else tr.playcol
+        lit = [memoryview(row.translate(LED_ON)) for row in tr.steps]  # once for all grids
         for g in self.grid_map.values(): # Iterate over the map's values
             # Defensive check in case a grid disconnects or its ID is not yet registered
             if g.id is None or g.id not in self.offsets:
                 continue
-            off=self.offsets[g.id]
+            off, w = self.offsets[g.id], g.width
+            # Build the whole frame flat (index y*w + x), then send only what changed.
+            # Frames alternate between two buffers per grid: the last one sent and a spare.
+            frame = self._spare_frame.pop(g.id, None)
+            if frame is None or len(frame) != ROWS * w:
+                frame = bytearray(ROWS * w)
             for y in range(ROWS):
-                row=[1 if state.cur.steps[y][x]>0 else 0 for x in range(off, off + g.width)]
-                # Overlay the playhead for the current track only
-                tr = state.cur
-                if not tr.mute and off <= tr.playcol < off + g.width:
-                    row[tr.playcol-off]=1
-                g.led_row(0, ROWS-1-y, row)
+                frame[y*w:(y+1)*w] = lit[y][off:off + w]
+            # Overlay the playhead for the current track only
+            if playcol is not None and off <= playcol < off + w:
+                for y in range(ROWS):
+                    frame[y*w + playcol - off] = 1
+
+            last = self._last_frame.get(g.id)
+            if last == frame:
+                self._spare_frame[g.id] = frame
+                continue  # nothing changed on this grid (one C-level compare)
+            if last is not None and len(last) != len(frame):
+                last = None
+            # Per changed 8x8 quad, send the smallest message covering the change:
+            # one LED -> led_set, one row -> led_row, one column -> led_col, else led_map
+            for qx in range(0, w, 8):
+                quad = self._quad(frame, w, qx)
+                if last is not None:
+                    old = self._quad(last, w, qx)
+                    if quad == old:
+                        continue
+                    # Compare whole rows first; only rows that differ are walked cell by cell
+                    changed = [(x, y) for y in range(ROWS) if quad[y] != old[y]
+                               for x in range(8) if quad[y][x] != old[y][x]]
+                    xs, ys = {x for x, _ in changed}, {y for _, y in changed}
+                    if len(changed) == 1:
+                        x, y = changed[0]
+                        g.led_set(qx + x, y, quad[y][x])
+                        continue
+                    if len(ys) == 1:  # e.g. a row of steps edited together
+                        y = ys.pop()
+                        g.led_row(qx, y, quad[y])
+                        continue
+                    if len(xs) == 1:  # e.g. the playhead entering or leaving this quad
+                        x = xs.pop()
+                        g.led_col(qx + x, 0, bytes(row[x] for row in quad))
+                        continue
+                g.led_map(qx, 0, quad)  # rows are bytearray slices; led_map only indexes them
+            self._last_frame[g.id] = frame
+            if last is not None:
+                self._spare_frame[g.id] = last
+
+    @staticmethod
+    def _quad(frame, w, qx):
+        """Returns the 8x8 block of a flat frame at column qx, in grid row order."""
+        return [frame[y*w + qx:y*w + qx + 8] for y in range(ROWS - 1, -1, -1)]
 
     
     # MIDI clock IN - ultra-lightweight callback
     def _clock_in(self, event, _):
-        # Skip processing if not in receive mode
-        if state.clock_mode != "receive": 
-            return
-        
         try:
-            msg, _ = event
-            if not msg:
-                return
-                
-            b = msg[0]
-            
-            # Process MIDI messages with minimal overhead
-            if b == 0xFA:  # MIDI Start
-                state.running = True
-                state.tick_count = 0
-                state.beat_counter = 0
-                for track in state.tracks:
-                    track.playcol = 0
-                print("MIDI Start")
-            elif b == 0xFB:  # MIDI Continue
-                state.running = True
-                print("MIDI Continue")
-            elif b == 0xFC:  # MIDI Stop
-                state.running = False
-                print("MIDI Stop")
-            elif b == 0xF8 and state.running:  # MIDI Clock - minimal processing
-                state.tick_count = (state.tick_count + 1) % 6
-                if state.tick_count == 0:
-                    self.midi_clock_pending = True
-        except:
+            self._process_midi_message(event[0])
+        except Exception:
             # Silently ignore callback errors to prevent timing issues
             pass
 
     # This clock runs in a separate thread to ensure its timing is not
     # affected by GUI workload or other asyncio tasks.
     def _threaded_clock_loop(self):
-        import time
+        self._raise_thread_priority()
+        perf_counter, step, sleep_until = time.perf_counter, self._safe_step, self._sleep_until
         while self.running:
-            # Poll for MIDI messages in receive mode (only if callback is not active)
-            if state.clock_mode == "receive" and self.midi_in and not self.midi_callback_active:
-                try:
-                    # Check for MIDI messages (polling)
-                    msg = self.midi_in.get_message()
-                    if msg and msg[0]:  # get_message returns (message, timestamp)
-                        self._process_midi_message(msg[0])
-                except Exception as e:
-                    pass
-            
-            # Handle pending MIDI clock ticks
-            if self.midi_clock_pending and state.clock_mode == "receive":
-                asyncio.run_coroutine_threadsafe(self._step(), self.loop)
-                self.midi_clock_pending = False
-            
-            if state.running and state.clock_mode in ("internal","send"):
-                # Safely schedule the _step coroutine to run on the main asyncio loop
-                asyncio.run_coroutine_threadsafe(self._step(), self.loop)
+            self._rewind()  # also while stopped, so a reset shows on the grids
+            if state.clock_mode == "receive":
+                self._wait_external_step()
+                # Keep logical time current so switching back to internal doesn't rush
+                self._logical_time = perf_counter()
+                continue
+
+            times = state._step_times
+            odd = state.beat_counter % 2
+            step_len, gate = times[odd]
+            t = self._logical_time  # set_bpm may re-anchor it from the GUI thread
+            if state.running:
+                # Queue this step's MIDI right here, stamped with its logical start and
+                # gate, so a busy asyncio loop (grid I/O, Tk) can't delay it
+                step(t, gate)
                 if state.clock_mode=="send":
-                    for _ in range(6): self.qmsg(0xF8)
-            step=60/state.bpm/4
-            sw=state.swing
-            delay=step*(1+sw) if state.beat_counter%2 else step*(1-sw)
-            time.sleep(delay)
+                    # Swing moves the notes only: the six 24 PPQN pulses stay on the
+                    # unswung 16th grid, which odd steps start off by the swing amount
+                    grid = (times[0][0] + times[1][0]) / 2
+                    start = t - times[0][0] + grid if odd else t
+                    pulse = grid / 6
+                    for k in range(6):
+                        self.qbatch_at(start + k * pulse, None, MIDI_CLOCK)
+            t += step_len
+            # More than a step behind (system sleep, long stall): skip the missed steps
+            # rather than firing them back-to-back
+            now = perf_counter()
+            if now - t > step_len:
+                t = now
+            self._logical_time = t
+            # Wake a little early: the step is computed and queued ahead, stamped with t,
+            # and the MIDI sender thread delivers it at t itself
+            sleep_until(t - LOOKAHEAD)
+
+    def _wait_external_step(self):
+        """Waits for the next external clock step (6 ticks) and schedules it."""
+        polling = self.midi_in and not self.midi_callback_active
+        # Poll for MIDI messages (only if callback is not active)
+        if polling:
+            try:
+                msg = self.midi_in.get_message()
+                if msg and msg[0]:  # get_message returns (message, timestamp)
+                    self._process_midi_message(msg[0])
+            except Exception as e:
+                pass
+        # Short timeout while polling; otherwise just often enough to notice mode changes
+        if self._clock_pulse.wait(SLEEP_RES if polling else 0.1):
+            self._clock_pulse.clear()
+            self._safe_step()
+
+    def _safe_step(self, on_at=None, gate=None):
+        """_step for the clock thread: a failing step is reported and skipped, since an
+        uncaught error would end the thread and stop the sequencer for good."""
+        try:
+            self._step(on_at, gate)
+        except Exception as e:
+            print(f"⚠ Step failed: {e!r}")
+
+    def set_bpm(self, bpm):
+        """Changes tempo without letting the clock rush to catch up on lost time."""
+        state.bpm = bpm
+        self._logical_time = max(self._logical_time, time.perf_counter())
+
+    def _sleep_until(self, deadline):
+        """Sleeps coarsely to just before the deadline, then spins the remainder."""
+        remaining = deadline - time.perf_counter() - SLEEP_RES
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < deadline:
+            time.sleep(0)  # releases the GIL while spinning
     
     def _process_midi_message(self, msg):
-        """Process a MIDI message (for polling mode)."""
+        """Process a MIDI message (shared by the rtmidi callback and polling mode)."""
         if not msg or state.clock_mode != "receive":
             return
             
         b = msg[0]
         
-        if b == 0xFA:  # MIDI Start
+        # Clock ticks (24 per beat) are by far the most frequent message, so test them first
+        if b == 0xF8:  # MIDI Clock
+            if state.running:
+                state.tick_count = (state.tick_count + 1) % 6
+                if state.tick_count == 0:
+                    self._clock_pulse.set()
+        elif b == 0xFA:  # MIDI Start
             state.running = True
             state.tick_count = 0
-            state.beat_counter = 0
-            for track in state.tracks:
-                track.playcol = 0
+            self.request_rewind()
             print("MIDI Start")
         elif b == 0xFB:  # MIDI Continue
             state.running = True
@@ -571,59 +956,72 @@ class Backend:
         elif b == 0xFC:  # MIDI Stop
             state.running = False
             print("MIDI Stop")
-        elif b == 0xF8 and state.running:  # MIDI Clock
-            state.tick_count = (state.tick_count + 1) % 6
-            if state.tick_count == 0:
-                self.midi_clock_pending = True
 
-    # step
-    async def _step(self):
+    def request_rewind(self):
+        """Moves every playhead back to the start before the next step; any thread."""
+        self._rewind_pending = True
+
+    def _rewind(self):
+        """Applies a pending request_rewind(). Clock thread only, so the reset can't
+        interleave with _step's beat_counter += 1."""
+        if self._rewind_pending:
+            self._rewind_pending = False
+            state.beat_counter = 0
+            for track in state.tracks:
+                track.playcol = 0
+            self.request_monome_redraw()
+
+    # step (runs on the clock thread; only the grid redraw is handed to the asyncio loop)
+    def _step(self, on_at=None, gate=None):
         # If no grids are connected, sequencer has 0 columns. Do nothing.
         if state.cols == 0:
             return
 
+        # Every track's notes share this step's on/off times, fixed here so later tempo
+        # or swing changes can't stretch them. External clock steps carry no stamp.
+        if on_at is None:
+            on_at = time.perf_counter()
+        off_at = on_at + (gate or state._gate_time)
+
+        self._rewind()
         did_play = False
+        beat = state.beat_counter
+        batches = {}  # output port -> (note-ons, note-offs) from every track on it
         for tr in state.tracks:
             if tr.mute:
                 continue
 
-            if (state.beat_counter % tr.subdivision) == 0:
+            sub = tr.subdivision
+            if (beat % sub) == 0:
                 did_play = True
 
                 # Calculate current playhead position for this track
-                tr.playcol = (state.beat_counter // tr.subdivision) % state.cols
-
-                scale_intervals = SCALES.get(tr.scale, SCALES["Chromatic"])
-                num_degrees = len(scale_intervals)
-
-                notes = []
-                for r in range(ROWS):
-                    vel = tr.steps[r][tr.playcol]
-                    if vel > 0:
-                        octave = r // num_degrees
-                        degree = r % num_degrees
-                        note_offset = (octave * 12) + scale_intervals[degree]
-                        note = tr.root_note + note_offset
-                        self.qmsg_to_port(tr.midi_out_port, 0x90 | tr.midi_chan, note, vel)
-                        notes.append(note)
-                asyncio.create_task(self._note_off(notes, tr.midi_chan, tr.midi_out_port))
+                col, ons, offs = tr.read_column(beat // sub)
+                tr.playcol = col
+
+                # Empty column (the common case in sparse patterns): nothing to play
+                if ons is None:
+                    continue
+
+                port = tr.midi_out_port
+                batch = batches.get(port)
+                if batch is None:
+                    batch = batches[port] = (bytearray(), bytearray())
+                batch[0].extend(ons)
+                batch[1].extend(offs)
+
+        # One queue entry per port for the ons and one for the offs, however many tracks
+        for port, (ons, offs) in batches.items():
+            self.qbatch_at(on_at, port, ons)
+            self.qbatch_at(off_at, port, offs)
 
         if did_play:
-            self.redraw_monome()
-            if self.gui and self.gui.canvas.winfo_exists():
-                try:
-                    self.gui.draw_grid()
-                except tk.TclError as e:
-                    print(f"GUI Error during draw_grid: {e}")
+            self.request_monome_redraw()  # the GUI picks up playhead moves on its own
 
         # Increment beat counter at the end of the step for all modes
         state.beat_counter += 1
 
 
-    async def _note_off(self, ns, ch, midi_out_port="MonomeSeq Out"):
-        await asyncio.sleep((60/state.bpm/4)*GATE_RATIO)
-        for n in ns: self.qmsg_to_port(midi_out_port, 0x80|ch, n, 0)
-
     def shutdown(self):
         self.running = False # Set running flag to false
         with contextlib.suppress(Exception): self._close_port(self.midi_out)
@@ -633,12 +1031,17 @@ class Backend:
 class SequencerGUI:
     def __init__(self,root,be:Backend):
         self.be=be; be.gui=self
+        self.root=root
+        self._drawn_playcol = None
+        self._redraw_pending = False
+        self._menu_ports = {}  # "in"/"out" -> port list the menu was last built from
         root.configure(bg="#222"); root.title("Monome Seq Tracks (Velocity)")
 
         # Canvas starts at 0 width, will be resized when grids connect
         self.canvas=tk.Canvas(root,width=0,height=ROWS*CELL_SIZE,
                               bg="#222",highlightthickness=0)
         self.canvas.pack(padx=8,pady=(8,4), fill="x", expand=True)
+        self._build_cells()
 
         ctrl=tk.Frame(root,bg="#222"); ctrl.pack(padx=8,pady=6,anchor="w")
         LF,BF=("Helvetica",10),("Helvetica",10,"bold")
@@ -646,7 +1049,7 @@ class SequencerGUI:
         # row0 BPM + Play + Reset
         tk.Label(ctrl,text="BPM",font=LF,fg="#ddd",bg="#222").grid(row=0,column=0,sticky="e")
         self.bpm=tk.Scale(ctrl,from_=40,to=300,orient="horizontal",length=90,
-                          command=lambda v:setattr(state,"bpm",int(float(v))),
+                          command=lambda v:self.be.set_bpm(int(float(v))),
                           bg="#222",fg="#ddd",troughcolor="#444",highlightthickness=0)
         self.bpm.set(state.bpm); self.bpm.grid(row=0,column=1,columnspan=2,sticky="we")
         self.play=tk.Button(ctrl,text="Stop",width=6,font=BF,bg="green",fg="red",
@@ -681,7 +1084,7 @@ class SequencerGUI:
         # MIDI In Port
         tk.Label(in_frame, text="Port", font=LF, fg="#ddd", bg="#222").pack(side="left", padx=(5,2))
         self.midi_in_port_var = tk.StringVar()
-        ins = self.be._get_port_names(self.be.midi_in)
+        ins = self.be.list_ports(True)
         
         # Prefer IAC Driver Bus 1 if available, otherwise first port
         preferred_port = ins[0] if ins else "None"
@@ -716,7 +1119,7 @@ class SequencerGUI:
 
         # MIDI Out Port (Per Track)
         tk.Label(out_frame, text="Port", font=LF, fg="#ddd", bg="#222").pack(side="left", padx=2)
-        outs = self.be._get_port_names(self.be.midi_out)
+        outs = self.be.list_ports(False)
         self.track_port = tk.StringVar(value=state.cur.midi_out_port)
         self.track_port_menu = tk.OptionMenu(out_frame, self.track_port, state.cur.midi_out_port, *outs, command=self._set_track_port)
         self.track_port_menu.config(width=15)
@@ -762,43 +1165,98 @@ class SequencerGUI:
           .pack(side="left", padx=4)
 
         self._refresh_ui()
+        self.root.after(FRAME_MS, self._maybe_draw)
 
     def resize_canvas(self, new_cols):
         self.canvas.config(width=new_cols * CELL_SIZE)
-        self.draw_grid()
+        self.request_redraw()
+
+    def request_redraw(self):
+        """Marks the grid dirty and repaints once Tk is idle; repeated calls coalesce."""
+        state.dirty = True
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        if state.dirty:
+            state.dirty = False
+            try:
+                self.draw_grid()
+            except tk.TclError as e:
+                print(f"GUI Error during draw_grid: {e}")
+
+    def _maybe_draw(self):
+        """Repaints at most once per frame: all cells if steps changed, else just the playhead."""
+        try:
+            if state.dirty:
+                state.dirty = False
+                self.draw_grid()
+            elif state.cur.playcol != self._drawn_playcol:
+                self._draw_playhead()
+        except tk.TclError as e:
+            print(f"GUI Error during draw_grid: {e}")
+        finally:
+            self.root.after(FRAME_MS, self._maybe_draw)  # an error must not stop repainting
+
+    def _build_cells(self):
+        """Creates the canvas items once per grid size; draw_grid only recolours them."""
+        c = self.canvas
+        c.delete("all")
+        self._cells, self._last_fill = [], []
+        for y in range(ROWS):
+            y0 = (ROWS - 1 - y) * CELL_SIZE
+            self._cells.append([c.create_oval(x*CELL_SIZE+3, y0+3, (x+1)*CELL_SIZE-3, y0+CELL_SIZE-3,
+                                              fill=FILL_OFF, outline="#333")
+                                for x in range(state.cols)])
+            self._last_fill.append([FILL_OFF] * state.cols)
+        self._drawn_steps = [bytes(state.cols)] * ROWS  # step rows as last painted
+        self._playhead = c.create_rectangle(0, 0, CELL_SIZE, ROWS * CELL_SIZE,
+                                            outline="#F19225", width=2, state="hidden")
+        self._playhead_coords = [(x * CELL_SIZE, 0, (x + 1) * CELL_SIZE, ROWS * CELL_SIZE)
+                                 for x in range(state.cols)]
+        self._drawn_playhead = None
 
     # ---- draw grid (3-level velocity shading) ----
     def draw_grid(self):
         c = self.canvas
-        c.delete("all")
         tr = state.cur  # This was the missing line
+        if len(self._cells[0]) != state.cols:
+            self._build_cells()
         if state.cols == 0: return
+        itemconfig, cols, drawn = c.itemconfig, range(state.cols), self._drawn_steps
         for y in range(ROWS):
-            disp = ROWS - 1 - y
-            for x in range(state.cols):
-                vel = tr.steps[y][x]
-
-                # colour by velocity
-                if vel == 0:
-                    fill = "#444"
-                elif vel <= 40:
-                    fill = "#3366FF"
-                elif vel <= 80:
-                    fill = "#33CC33"
-                else:
-                    fill = "#FFCC00"
-
-                x0, y0 = x * CELL_SIZE, disp * CELL_SIZE
-                c.create_oval(x0+3, y0+3, x0+CELL_SIZE-3, y0+CELL_SIZE-3,
-                            fill=fill, outline="#333")
-
-        # Draw the playhead for the current track only
-        if not tr.mute:
-            c.create_rectangle(
-                tr.playcol * CELL_SIZE, 0,
-                (tr.playcol + 1) * CELL_SIZE, ROWS * CELL_SIZE,
-                outline="#F19225", width=2
-            )
+            steps = tr.steps[y]
+            if steps == drawn[y]:
+                continue  # row unchanged since the last paint (one C-level compare)
+            cells, last = self._cells[y], self._last_fill[y]
+            for x in cols:
+                fill = VEL_FILL[steps[x]]  # colour by velocity
+                if fill != last[x]:
+                    itemconfig(cells[x], fill=fill)
+                    last[x] = fill
+            drawn[y] = bytes(steps)
+
+        self._draw_playhead()
+
+    def _draw_playhead(self):
+        """Moves the playhead rectangle for the current track only."""
+        c = self.canvas
+        tr = state.cur
+        self._drawn_playcol = tr.playcol
+        if state.cols == 0 or len(self._playhead_coords) != state.cols:
+            return  # grid resized; the pending full draw rebuilds the items first
+        playhead = None if tr.mute else tr.playcol
+        if playhead is not None and playhead >= len(self._playhead_coords):
+            return  # a step computed before a shrink landed after it; the next one fixes it
+        if playhead != self._drawn_playhead:
+            if playhead is None:
+                c.itemconfig(self._playhead, state="hidden")
+            else:
+                c.coords(self._playhead, *self._playhead_coords[playhead])
+                c.itemconfig(self._playhead, state="normal")
+            self._drawn_playhead = playhead
 
     # ---- mouse clicks ----
     def _click(self, ev):
@@ -808,15 +1266,15 @@ class SequencerGUI:
             cur = state.cur
             vel = cur.steps[row][col]
             if vel == 0:
-                cur.steps[row][col] = 40
+                cur.set_step(row, col, 40)
             elif vel == 40:
-                cur.steps[row][col] = 80
+                cur.set_step(row, col, 80)
             elif vel == 80:
-                cur.steps[row][col] = 127
+                cur.set_step(row, col, 127)
             else:
-                cur.steps[row][col] = 0
-            self.draw_grid()
-            self.be.redraw_monome()
+                cur.set_step(row, col, 0)
+            self.request_redraw()
+            self.be.request_monome_redraw()
 
     def _save_pattern(self):
         # First, ensure any pending edit in the track name entry is saved to the state.
@@ -835,7 +1293,7 @@ class SequencerGUI:
         }
         for track in state.tracks:
             data_to_save['tracks'].append({
-                'name': track.name, 'steps': track.steps,
+                'name': track.name, 'steps': [list(row) for row in track.steps],
                 'midi_chan': track.midi_chan,
                 'midi_out_port': track.midi_out_port,
                 'mute': track.mute, 'scale': track.scale,
@@ -858,18 +1316,18 @@ class SequencerGUI:
         except (IOError, json.JSONDecodeError) as e:
             print(f"Error loading file: {e}"); return
 
-        state.bpm = loaded_data.get('bpm', 120)
+        self.be.set_bpm(loaded_data.get('bpm', 120))
         state.swing = loaded_data.get('swing', 0.0)
         for i, track_data in enumerate(loaded_data.get('tracks', [])):
             if i < len(state.tracks):
                 for key, val in track_data.items():
                     if key == 'steps':
                         loaded_steps = val
-                        new_steps = [[0] * state.cols for _ in range(ROWS)]
+                        new_steps = []
                         for r in range(ROWS):
-                            for c in range(min(len(loaded_steps[r]), state.cols)):
-                                new_steps[r][c] = loaded_steps[r][c]
-                        state.tracks[i].steps = new_steps
+                            row = bytearray(max(0, min(127, int(v))) for v in loaded_steps[r][:state.cols])
+                            new_steps.append(row + bytearray(state.cols - len(row)))
+                        state.tracks[i].set_steps(new_steps)
                     elif hasattr(state.tracks[i], key):
                         setattr(state.tracks[i], key, val)
                 
@@ -885,13 +1343,15 @@ class SequencerGUI:
         self.be.set_in_port(selected_port)
     
     def _refresh_midi_ports(self):
-        outs = self.be._get_port_names(self.be.midi_out)
+        outs = self.be.list_ports(False)
         if outs:
-            # Update track-specific MIDI output port menu
-            menu = self.track_port_menu.children["menu"]
-            menu.delete(0, "end")  # Clear existing options
-            for port_name in outs:
-                menu.add_command(label=port_name, command=tk._setit(self.track_port, port_name, self._set_track_port))
+            # Update track-specific MIDI output port menu, unless the ports are unchanged
+            if outs != self._menu_ports.get("out"):
+                self._menu_ports["out"] = outs
+                menu = self.track_port_menu.children["menu"]
+                menu.delete(0, "end")  # Clear existing options
+                for port_name in outs:
+                    menu.add_command(label=port_name, command=tk._setit(self.track_port, port_name, self._set_track_port))
             # Only set to first port if no port is currently selected
             if not self.track_port.get() or self.track_port.get() == "No devices found":
                 self.track_port.set(outs[0])
@@ -933,11 +1393,7 @@ class SequencerGUI:
     def _reset_sequence(self):
         """Resets all track playheads and counters to the beginning."""
         print("Resetting sequence to start.")
-        state.beat_counter = 0
-        for track in state.tracks:
-            track.playcol = 0
-        self.draw_grid()
-        self.be.redraw_monome()
+        self.be.request_rewind()  # applied on the clock thread, which owns beat_counter
 
     # ---- control callbacks ----
     def _toggle(self):
@@ -954,18 +1410,18 @@ class SequencerGUI:
         # Ensure the port is available in backend
         self.be.get_midi_output(port_name)
     def _toggle_mute(self):
-        state.cur.mute=bool(self.mute_var.get()); self.be.redraw_monome()
+        state.cur.mute=bool(self.mute_var.get()); self.request_redraw(); self.be.request_monome_redraw()
 
     # track navigation
     def next_track(self):
         state.cur_idx=(state.cur_idx+1)%TRACKS
         self._refresh_ui()
-        self.be.redraw_monome()
+        self.be.request_monome_redraw()
 
     def prev_track(self):
         state.cur_idx=(state.cur_idx-1)%TRACKS
         self._refresh_ui()
-        self.be.redraw_monome()
+        self.be.request_monome_redraw()
 
     def _refresh_ui(self):
         """Updates all GUI elements for the current track, but does NOT touch hardware."""
@@ -992,17 +1448,19 @@ class SequencerGUI:
         subdiv_name = next((k for k, v in SUBDIVISIONS.items() if v == state.cur.subdivision), "1/16")
         self.subdiv_var.set(subdiv_name)
 
-        self.draw_grid()
+        self.request_redraw()
 
     def refresh_midi_in_ports(self):
         """Refresh MIDI input port options without changing current selection."""
-        ports = self.be._get_port_names(self.be.midi_in)
+        ports = self.be.list_ports(True)
         if ports:
-            # Update the menu options
-            menu = self.midi_in_menu.children["menu"]
-            menu.delete(0, "end")  # Clear existing options
-            for port_name in ports:
-                menu.add_command(label=port_name, command=tk._setit(self.midi_in_port_var, port_name))
+            # Update the menu options, unless the ports are unchanged
+            if ports != self._menu_ports.get("in"):
+                self._menu_ports["in"] = ports
+                menu = self.midi_in_menu.children["menu"]
+                menu.delete(0, "end")  # Clear existing options
+                for port_name in ports:
+                    menu.add_command(label=port_name, command=tk._setit(self.midi_in_port_var, port_name))
             # Only set to first port if no port is currently selected
             if not self.midi_in_port_var.get() or self.midi_in_port_var.get() == "No devices found":
                 self.midi_in_port_var.set(ports[0])
@@ -1023,13 +1481,22 @@ async def main():
 
   root.protocol("WM_DELETE_WINDOW", on_close)  # Register the close handler
 
-  try:
-      while be.running:  # Run as long as the backend is running
+  # Tk is pumped by an event-loop callback rather than a sleep-polling loop,
+  # so asyncio wakes only for real work and scheduled pumps.
+  closed = asyncio.Event()
+
+  def tk_pump():
+      if not be.running:  # Run as long as the backend is running
+          closed.set(); return
+      try:
           root.update()
-          await asyncio.sleep(0.01)
-  except (tk.TclError, RuntimeError):
-      # This can happen if the window is closed abruptly.
-      pass
+      except (tk.TclError, RuntimeError):
+          # This can happen if the window is closed abruptly.
+          closed.set(); return
+      loop.call_later(TK_PUMP_MS / 1000, tk_pump)
+
+  loop.call_soon(tk_pump)
+  await closed.wait()
 
 if __name__=="__main__":
     asyncio.run(main())